@@ -1,4 +1,6 @@
 import base64
+import functools
+import warnings
 from base64 import b64encode
 from hashlib import md5
 from typing import Optional
@@ -11,6 +13,26 @@ except ImportError:
     crcmod = None
 
 
+@functools.lru_cache(maxsize=None)
+def _import_google_crc32c():
+    """Return the google_crc32c module if it should be used, else None.
+
+    Imported on first use only: without its compiled extension the package
+    warns at import time, and in that case crcmod is preferred if installed.
+    The result is cached, so checkers built later skip the warnings handling.
+    """
+    with warnings.catch_warnings():
+        if crcmod is not None:
+            warnings.simplefilter("ignore", RuntimeWarning)
+        try:
+            import google_crc32c
+        except ImportError:
+            return None
+    if google_crc32c.implementation != "c" and crcmod is not None:
+        return None
+    return google_crc32c
+
+
 class ConsistencyChecker:
     def __init__(self):
         pass
@@ -77,7 +99,11 @@ class SizeChecker(ConsistencyChecker):
 
 class Crc32cChecker(ConsistencyChecker):
     def __init__(self):
-        self.crc32c = crcmod.Crc(0x11EDC6F41, initCrc=0, xorOut=0xFFFFFFFF)
+        google_crc32c = _import_google_crc32c()
+        if google_crc32c is not None:
+            self.crc32c = google_crc32c.Checksum()
+        else:
+            self.crc32c = crcmod.Crc(0x11EDC6F41, initCrc=0, xorOut=0xFFFFFFFF)
 
     def update(self, data: bytes):
         self.crc32c.update(data)
@@ -110,9 +136,10 @@ def get_consistency_checker(consistency: Optional[str]) -> ConsistencyChecker:
     elif consistency == "md5":
         return MD5Checker()
     elif consistency == "crc32c":
-        if crcmod is None:
+        if crcmod is None and _import_google_crc32c() is None:
             raise ImportError(
-                "The python package `crcmod` is required for `consistency='crc32c'`. "
+                "The python package `google-crc32c` or `crcmod` is required for "
+                "`consistency='crc32c'`. "
                 "This can be installed with `pip install gcsfs[crc]`"
             )
         else:
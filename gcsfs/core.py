@@ -9,6 +9,7 @@ import logging
 import mimetypes
 import os
 import posixpath
+import random
 import re
 import warnings
 import weakref
@@ -473,7 +474,9 @@ class GCSFileSystem(asyn.AsyncFileSystem):
     async def _call(
         self, method, path, *args, json_out=False, info_out=False, **kwargs
     ):
-        logger.debug(f"{method.upper()}: {path}, {args}, {kwargs.get('headers')}")
+        logger.debug(
+            "%s: %s, %s, %s", method.upper(), path, args, kwargs.get("headers")
+        )
         status, headers, info, contents = await self._request(
             method, path, *args, **kwargs
         )
@@ -1225,8 +1228,6 @@ class GCSFileSystem(asyn.AsyncFileSystem):
             await self._rmdir(path)
 
     async def _rm_files(self, paths):
-        import random
-
         template = (
             "\n--===============7330845974216740156==\n"
             "Content-Type: application/http\n"
@@ -1978,6 +1979,10 @@ class GCSFile(fsspec.spec.AbstractBufferedFile):
         start, end : None or integers
             if not both None, fetch only given range
         """
+        if start is not None and start >= 0:
+            if start >= self.size or (end is not None and 0 <= end <= start):
+                # nothing to fetch; avoid a request that can only be refused
+                return b""
         try:
             return self.gcsfs.cat_file(self.path, start=start, end=end)
         except RuntimeError as e:
@@ -2058,7 +2063,7 @@ async def initiate_upload(
     loc = headers["Location"]
     out = loc[0] if isinstance(loc, list) else loc  # <- for CVR responses
     if len(str(loc)) < 20:
-        logger.error("Location failed: %s" % headers)
+        logger.error("Location failed: %s", headers)
     return out
 
 
@@ -236,9 +236,7 @@ class GoogleCredentials:
                 except (google.auth.exceptions.GoogleAuthError, ValueError) as e:
                     # GoogleAuthError is the base class for all authentication
                     # errors
-                    logger.debug(
-                        'Connection with method "%s" failed' % meth, exc_info=e
-                    )
+                    logger.debug('Connection with method "%s" failed', meth, exc_info=e)
                     # Reset credentials if they were set but the authentication failed
                     # (reverts to 'anon' behavior)
                     self.credentials = None
@@ -64,7 +64,7 @@ errs = list(range(500, 505)) + [
     # Too Many Requests
     429,
 ]
-errs = set(errs + [str(e) for e in errs])
+errs = frozenset(errs + [str(e) for e in errs])
 
 
 def is_retriable(exception):
@@ -158,10 +158,10 @@ async def retry_request(func, retries=6, *args, **kwargs):
                 logger.debug("Request returned 404, no retries.")
                 raise e
             if retry == retries - 1:
-                logger.exception(f"{func.__name__} out of retries on exception: {e}")
+                logger.exception("%s out of retries on exception: %s", func.__name__, e)
                 raise e
             if is_retriable(e):
-                logger.debug(f"{func.__name__} retrying after exception: {e}")
+                logger.debug("%s retrying after exception: %s", func.__name__, e)
                 continue
-            logger.exception(f"{func.__name__} non-retriable exception: {e}")
+            logger.exception("%s non-retriable exception: %s", func.__name__, e)
             raise e
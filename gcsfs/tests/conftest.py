@@ -2,6 +2,7 @@ import os
 import shlex
 import subprocess
 import time
+from contextlib import contextmanager
 
 import fsspec
 import pytest
@@ -99,9 +100,9 @@ def gcs_factory(docker_gcs):
     return factory
 
 
-@pytest.fixture
-def gcs(gcs_factory, populate=True):
-    gcs = gcs_factory()
+@contextmanager
+def populated_bucket(gcs, populate=True):
+    """Recreate TEST_BUCKET, optionally filled with ``allfiles``, and clean up after."""
     try:
         # ensure we're empty.
         try:
@@ -125,6 +126,12 @@ def gcs(gcs_factory, populate=True):
             pass
 
 
+@pytest.fixture
+def gcs(gcs_factory, populate=True):
+    with populated_bucket(gcs_factory(), populate=populate) as gcs:
+        yield gcs
+
+
 @pytest.fixture
 def gcs_versioned(gcs_factory):
     gcs = gcs_factory()
@@ -3,7 +3,7 @@ import pytest
 from fsspec.tests.abstract import AbstractFixtures
 
 from gcsfs.core import GCSFileSystem
-from gcsfs.tests.conftest import allfiles
+from gcsfs.tests.conftest import populated_bucket
 from gcsfs.tests.settings import TEST_BUCKET
 
 
@@ -12,26 +12,8 @@ class GcsfsFixtures(AbstractFixtures):
     def fs(self, docker_gcs):
         GCSFileSystem.clear_instance_cache()
         gcs = fsspec.filesystem("gcs", endpoint_url=docker_gcs)
-        try:
-            # ensure we're empty.
-            try:
-                gcs.rm(TEST_BUCKET, recursive=True)
-            except FileNotFoundError:
-                pass
-            try:
-                gcs.mkdir(TEST_BUCKET)
-            except Exception:
-                pass
-
-            gcs.pipe({TEST_BUCKET + "/" + k: v for k, v in allfiles.items()})
-            gcs.invalidate_cache()
+        with populated_bucket(gcs) as gcs:
             yield gcs
-        finally:
-            try:
-                gcs.rm(gcs.find(TEST_BUCKET))
-                gcs.rm(TEST_BUCKET)
-            except:  # noqa: E722
-                pass
 
     @pytest.fixture
     def fs_path(self):
@@ -3,7 +3,14 @@ from hashlib import md5
 
 import pytest
 
-from gcsfs.checkers import Crc32cChecker, MD5Checker, SizeChecker, crcmod
+import gcsfs.checkers
+from gcsfs.checkers import (
+    Crc32cChecker,
+    MD5Checker,
+    SizeChecker,
+    crcmod,
+    get_consistency_checker,
+)
 from gcsfs.retry import ChecksumError
 
 
@@ -167,3 +174,45 @@ def test_checker_validate_json_response(checker, data, actual_data, raises):
             checker.validate_json_response(response)
     else:
         checker.validate_json_response(response)
+
+
+@pytest.mark.parametrize("backend", ["google_crc32c", "crcmod"])
+def test_crc32c_backends(backend, monkeypatch):
+    if backend == "crcmod":
+        if crcmod is None:
+            pytest.skip("crcmod not installed")
+        monkeypatch.setattr(gcsfs.checkers, "_import_google_crc32c", lambda: None)
+    else:
+        monkeypatch.setattr(gcsfs.checkers, "crcmod", None)
+        # bypass the cache so the choice is made without crcmod
+        uncached = gcsfs.checkers._import_google_crc32c.__wrapped__
+        monkeypatch.setattr(gcsfs.checkers, "_import_google_crc32c", uncached)
+        if uncached() is None:
+            pytest.skip("google-crc32c not installed")
+
+    checker = get_consistency_checker("crc32c")
+    checker.update(b"hello ")
+    checker.update(b"world\n")
+    checker.validate_json_response({"crc32c": "8P9ykg=="})
+    checker.validate_headers({"X-Goog-Hash": "crc32c=8P9ykg==, md5=xxx"})
+    with pytest.raises(ChecksumError):
+        checker.validate_json_response({"crc32c": "DoesntMatter=="})
+
+
+def test_crc32c_requires_backend(monkeypatch):
+    monkeypatch.setattr(gcsfs.checkers, "_import_google_crc32c", lambda: None)
+    monkeypatch.setattr(gcsfs.checkers, "crcmod", None)
+    with pytest.raises(ImportError):
+        get_consistency_checker("crc32c")
+
+
+def test_crc32c_backend_cached():
+    gcsfs.checkers._import_google_crc32c.cache_clear()
+    try:
+        get_consistency_checker("crc32c")
+    except ImportError:
+        pytest.skip("No CRC")
+    get_consistency_checker("crc32c")
+    info = gcsfs.checkers._import_google_crc32c.cache_info()
+    assert info.misses == 1
+    assert info.hits >= 1
@@ -18,6 +18,7 @@ import gcsfs.tests.settings
 from gcsfs import __version__ as version
 from gcsfs.core import GCSFileSystem, quote
 from gcsfs.credentials import GoogleCredentials
+from gcsfs.retry import HttpError
 from gcsfs.tests.conftest import a, allfiles, b, csv_files, files, text_files
 from gcsfs.tests.utils import tempdir, tmpfile
 
@@ -444,8 +445,11 @@ def test_cat_file(gcs):
 
 @pytest.mark.parametrize("consistency", [None, "size", "md5", "crc32c"])
 def test_get_put(consistency, gcs):
-    if consistency == "crc32c" and gcsfs.checkers.crcmod is None:
-        pytest.skip("No CRC")
+    if consistency == "crc32c":
+        try:
+            gcsfs.checkers.get_consistency_checker(consistency)
+        except ImportError:
+            pytest.skip("No CRC")
     if consistency == "size" and not gcs.on_google:
         pytest.skip("emulator does not return size")
     gcs.consistency = consistency
@@ -607,6 +611,33 @@ def test_read_small(gcs):
         assert len(f.cache.cache) < len(out)
 
 
+def test_fetch_range_empty(gcs):
+    fn = TEST_BUCKET + "/2014-01-01.csv"
+    with gcs.open(fn, "rb") as f:
+        with mock.patch.object(gcs, "cat_file") as mock_cat_file:
+            assert f._fetch_range(f.size, f.size + 10) == b""
+            assert f._fetch_range(f.size + 5, None) == b""
+            assert f._fetch_range(3, 3) == b""
+        mock_cat_file.assert_not_called()
+        data = csv_files["2014-01-01.csv"]
+        assert f._fetch_range(0, 4) == data[:4]
+        # negative offsets count from the end and are left to cat_file
+        assert f._fetch_range(0, -1) == data[:-1]
+        assert f._fetch_range(10, -1) == data[10:-1]
+        assert f._fetch_range(-4, None) == data[-4:]
+
+
+def test_fetch_range_not_satisfiable(gcs):
+    fn = TEST_BUCKET + "/2014-01-01.csv"
+    with gcs.open(fn, "rb") as f:
+        # a refused in-bounds range means the object changed; do not
+        # hand back a silently truncated read
+        err = HttpError({"code": 416, "message": "Request range not satisfiable"})
+        with mock.patch.object(gcs, "cat_file", side_effect=err):
+            with pytest.raises(HttpError):
+                f._fetch_range(0, 4)
+
+
 def test_seek_delimiter(gcs):
     fn = "test/accounts.1.json"
     data = files[fn]
@@ -1,42 +1,18 @@
 import os
-import shutil
 import tempfile
 from contextlib import contextmanager
 
 
-@contextmanager
-def ignoring(*exceptions):
-    try:
-        yield
-    except exceptions:
-        pass
-
-
 @contextmanager
 def tempdir(dir=None):
-    dirname = tempfile.mkdtemp(dir=dir)
-    shutil.rmtree(dirname, ignore_errors=True)
-
-    try:
-        yield dirname
-    finally:
-        if os.path.exists(dirname):
-            shutil.rmtree(dirname, ignore_errors=True)
+    """Yield a not-yet-existing directory path, removed on exit if created."""
+    with tempfile.TemporaryDirectory(dir=dir) as parent:
+        yield os.path.join(parent, "tmp")
 
 
 @contextmanager
 def tmpfile(extension="", dir=None):
+    """Yield a not-yet-existing file path, removed on exit if created."""
     extension = "." + extension.lstrip(".")
-    handle, filename = tempfile.mkstemp(extension, dir=dir)
-    os.close(handle)
-    os.remove(filename)
-
-    try:
-        yield filename
-    finally:
-        if os.path.exists(filename):
-            if os.path.isdir(filename):
-                shutil.rmtree(filename)
-            else:
-                with ignoring(OSError):
-                    os.remove(filename)
+    with tempfile.TemporaryDirectory(dir=dir) as parent:
+        yield os.path.join(parent, "tmp" + extension)
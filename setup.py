@@ -32,7 +32,7 @@ setup(
     long_description=(
         open("README.rst").read() if os.path.exists("README.rst") else ""
     ),
-    extras_require={"gcsfuse": ["fusepy"], "crc": ["crcmod"]},
+    extras_require={"gcsfuse": ["fusepy"], "crc": ["crcmod", "google-crc32c>=1.5"]},
     python_requires=">=3.9",
     zip_safe=False,
 )